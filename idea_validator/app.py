@@ -6,57 +6,334 @@ so it is easy to copy and adapt for future ideas.
 
 from __future__ import annotations
 
-import csv
-import io
+import atexit
+import hashlib
 import logging
-import re
+import os
+import queue
 import sqlite3
+import tempfile
+import threading
+import weakref
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any
-
-from flask import Flask, Response, redirect, render_template, request, url_for
+from types import MappingProxyType
+from typing import Any, BinaryIO
+
+from flask import (
+    Flask,
+    Response,
+    redirect,
+    render_template,
+    request,
+    send_file,
+    url_for,
+)
+from markupsafe import Markup
 
 import config
 
 BASE_DIR = Path(__file__).resolve().parent
 DB_PATH = BASE_DIR / "database.db"
-
-# Basic email regex (simple and beginner-friendly, not overly strict).
-EMAIL_REGEX = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+# Bump this whenever init_db() changes the schema so existing databases get updated.
+SCHEMA_VERSION = 2
+# CSV export snapshots (auto-created, safe to delete).
+EXPORT_DIR = BASE_DIR / "exports"
 
 app = Flask(__name__)
 
 # Console logging helps you see successful signups in development and production logs.
-logging.basicConfig(level=logging.INFO)
+# Set the LOG_LEVEL environment variable (e.g. WARNING) to make production quieter.
+# Requests only drop log records into a queue; a background thread writes them out,
+# so a slow console or log file never holds up a response.
+_log_handler = QueueHandler(queue.SimpleQueue())
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    handlers=[_log_handler],
+)
 logger = logging.getLogger(__name__)
 
 
-def get_db_connection() -> sqlite3.Connection:
-    """Create a new SQLite connection.
+def _start_log_listener() -> None:
+    """Start the background thread that writes queued log records to the console.
+
+    Threads do not survive fork(), so servers that import the app and then fork
+    workers (e.g. gunicorn --preload) call this again in each worker. A fresh queue
+    is used there too, in case the parent was holding the old queue's lock.
+    """
+    global _log_listener
+    _log_handler.queue = queue.SimpleQueue()
+    _log_listener = QueueListener(_log_handler.queue, logging.StreamHandler())
+    _log_listener.start()
+
+
+@atexit.register
+def _stop_log_listener() -> None:
+    """Write out any queued log records before the process exits."""
+    _log_listener.stop()
+
+
+_start_log_listener()
+if hasattr(os, "register_at_fork"):  # Not available on Windows.
+    os.register_at_fork(after_in_child=_start_log_listener)
+
+# First line of the CSV export. Rows use "\r\n" line endings like the csv module does.
+CSV_HEADER = "id,email,poll_answer,created_at\r\n"
+
+# How many rows the CSV export reads from the database at a time.
+EXPORT_BATCH_SIZE = 10_000
+
+# SQL run on every request, kept as constants so each statement is always the exact
+# same string. sqlite3 caches prepared statements by their SQL text, so after the
+# first use a query skips SQLite's parser and planner.
+EMAIL_EXISTS_SQL = "SELECT 1 FROM submissions WHERE email = ? LIMIT 1"
+
+# SQLite fills in the UTC timestamp itself. It is spelled out here rather than left
+# to the column default so databases created before that default existed keep working.
+INSERT_SUBMISSION_SQL = """
+    INSERT INTO submissions (email, poll_answer, created_at)
+    VALUES (?, ?, strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+"""
+
+BULK_INSERT_SUBMISSIONS_SQL = """
+    INSERT OR IGNORE INTO submissions (email, poll_answer, created_at)
+    VALUES (?, ?, ?)
+"""
+
+EXPORT_FIRST_BATCH_SQL = """
+    SELECT id, email, poll_answer, created_at FROM submissions
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
+
+# Identifies the current contents of the submissions table (see init_db()).
+EXPORT_VERSION_SQL = "SELECT database_id || '-' || version FROM export_state"
+
+# Continues right after the last (created_at, id) pair of the previous batch.
+EXPORT_NEXT_BATCH_SQL = """
+    SELECT id, email, poll_answer, created_at FROM submissions
+    WHERE (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
+
+# Characters that make spreadsheet apps treat a cell as a formula.
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@")
+
+# Template values from config.py never change while the app runs, so they are
+# collected once here. The read-only view stops anyone from changing it by accident.
+_BASE_CONTEXT: Mapping[str, Any] = MappingProxyType(
+    {
+        "site_title": config.SITE_TITLE,
+        "headline": config.HEADLINE,
+        "description": config.DESCRIPTION,
+        "poll_question": config.POLL_QUESTION,
+    }
+)
+
+# Rendered landing page and its ETag, filled in by index() on the first request.
+# Rendering happens inside a real request so url_for() builds the right links.
+# Page and ETag live in one tuple so a request never sees one without the other.
+_index_cache: tuple[bytes, str] | None = None
+
+# One SQLite connection per server thread, reused across requests.
+_thread_local = threading.local()
+
+
+def open_db_connection() -> sqlite3.Connection:
+    """Open and configure a brand new SQLite connection.
 
     We use sqlite3.Row so rows can be accessed like dictionaries
     (e.g., row["email"]) which is easier to read.
+
+    isolation_level=None turns off Python's implicit transactions, so writes use
+    the explicit transaction() helper below instead.
+
+    The pragmas below only last for this connection, so they are applied every time.
+    synchronous=NORMAL is safe in WAL mode and avoids a full fsync on every commit.
     """
-    connection = sqlite3.connect(DB_PATH)
+    connection = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
     connection.row_factory = sqlite3.Row
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA busy_timeout=5000")
+    connection.execute("PRAGMA temp_store=MEMORY")
+    connection.execute("PRAGMA cache_size=-20000")
     return connection
 
 
+class _PooledConnection:
+    """Holds one thread's connection and closes it when that thread goes away.
+
+    Only the thread-local storage keeps a strong reference to this object. When the
+    thread ends (e.g. the dev server's one-thread-per-request mode), the object is
+    garbage collected and __del__ closes the connection, so none are leaked.
+    """
+
+    __slots__ = ("connection", "__weakref__")
+
+    def __init__(self) -> None:
+        self.connection = open_db_connection()
+        _pooled_connections.add(self)
+
+    def __del__(self) -> None:
+        self.connection.close()
+
+
+# Weak references only, so this set never keeps a finished thread's connection alive.
+_pooled_connections: weakref.WeakSet[_PooledConnection] = weakref.WeakSet()
+
+
+def get_db_connection() -> sqlite3.Connection:
+    """Return this thread's shared SQLite connection, opening it on first use.
+
+    Each server thread keeps one connection for its whole life, so requests skip
+    the cost of reopening the database file and re-applying pragmas.
+    """
+    pooled = getattr(_thread_local, "pooled", None)
+    if pooled is None:
+        pooled = _PooledConnection()
+        _thread_local.pooled = pooled
+    return pooled.connection
+
+
+@atexit.register
+def close_db_connections() -> None:
+    """Close the connections of threads still running when the process exits."""
+    for pooled in list(_pooled_connections):
+        pooled.connection.close()
+
+
+@contextmanager
+def transaction(connection: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the enclosed writes in one transaction.
+
+    BEGIN IMMEDIATE takes the write lock up front, so busy_timeout handles
+    concurrent writers instead of failing halfway through the transaction.
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+        connection.execute("COMMIT")
+    except BaseException:
+        # Also covers a failed COMMIT (e.g. disk full), which would otherwise leave
+        # this thread's pooled connection stuck inside an open transaction.
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+        raise
+
+
 def init_db() -> None:
-    """Create the submissions table if it does not already exist."""
-    with get_db_connection() as connection:
-        connection.execute(
-            """
-            CREATE TABLE IF NOT EXISTS submissions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                poll_answer TEXT NOT NULL,
-                created_at TEXT NOT NULL
+    """Create the submissions table and its index if they do not already exist.
+
+    The schema version is stored in SQLite's user_version header field, so once a
+    database is up to date this only reads one pragma instead of re-running the DDL
+    in every worker process.
+
+    This uses its own short-lived connection (not the pooled one) because it runs
+    at import time, before production servers fork their worker processes.
+    """
+    connection = open_db_connection()
+    try:
+        if connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
+
+        # WAL mode is stored in the database file itself, so setting it once is enough.
+        # It lets the CSV export read while new signups are being written.
+        connection.execute("PRAGMA journal_mode=WAL")
+        with transaction(connection):
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS submissions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    email TEXT UNIQUE NOT NULL,
+                    poll_answer TEXT NOT NULL,
+                    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+                )
+                """
+            )
+            # Lets the newest-first CSV export walk an index instead of sorting the table.
+            connection.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_submissions_created_at
+                ON submissions (created_at DESC, id DESC)
+                """
             )
-            """
+            # The CSV export snapshot is keyed on export_state. database_id is random per
+            # database file, so a recreated database never reuses an old snapshot, and
+            # the triggers bump version on every change to submissions, including
+            # edits made outside the app (e.g. with the sqlite3 command line tool).
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS export_state (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    database_id TEXT NOT NULL,
+                    version INTEGER NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                """
+                INSERT OR IGNORE INTO export_state (id, database_id, version)
+                VALUES (1, lower(hex(randomblob(16))), 0)
+                """
+            )
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                connection.execute(
+                    f"""
+                    CREATE TRIGGER IF NOT EXISTS submissions_export_{event.lower()}
+                    AFTER {event} ON submissions
+                    BEGIN
+                        UPDATE export_state SET version = version + 1;
+                    END
+                    """
+                )
+            connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    finally:
+        connection.close()
+
+
+def bulk_insert_submissions(rows: Iterable[tuple[str, str, str]]) -> int:
+    """Insert many (email, poll_answer, created_at) rows in a single transaction.
+
+    Meant for imports/backfills: one commit for the whole batch is far faster than
+    one commit per row. Rows get the same normalization and validation as the signup
+    form, and created_at must be an ISO 8601 timestamp. If any row is invalid a
+    ValueError is raised and nothing is inserted. Emails that already exist are
+    skipped. Returns how many rows were actually inserted.
+    """
+    clean_rows = []
+    for number, (raw_email, raw_poll_answer, raw_created_at) in enumerate(rows, start=1):
+        email, poll_answer, error = parse_submission_form(
+            {"email": raw_email, "poll_answer": raw_poll_answer}
         )
-        connection.commit()
+        if error:
+            raise ValueError(f"Row {number}: {error}")
+        clean_rows.append((email, poll_answer, normalize_timestamp(raw_created_at, number)))
+
+    connection = get_db_connection()
+    with transaction(connection):
+        cursor = connection.executemany(BULK_INSERT_SUBMISSIONS_SQL, clean_rows)
+    return cursor.rowcount
+
+
+def normalize_timestamp(value: str, row_number: int) -> str:
+    """Convert an ISO 8601 timestamp to the UTC format SQLite uses for new signups.
+
+    Timestamps without a timezone are treated as UTC. Using one format everywhere
+    keeps the newest-first export order correct.
+    """
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise ValueError(f"Row {row_number}: invalid created_at {value!r}") from None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.") + (
+        f"{parsed.microsecond // 1000:03d}Z"
+    )
 
 
 def normalize_text(value: str) -> str:
@@ -69,8 +346,41 @@ def normalize_text(value: str) -> str:
 
 
 def is_valid_email(email: str) -> bool:
-    """Return True if email format passes our basic regex check."""
-    return bool(EMAIL_REGEX.match(email))
+    """Return True if email looks like "name@domain.tld".
+
+    This is a basic check (simple and beginner-friendly, not overly strict):
+    exactly one "@", something before it, a dot inside the domain part and no
+    whitespace. Plain string methods run in C with a linear scan, so unusual input
+    can never cause slow regex backtracking.
+    """
+    local_part, at_sign, domain = email.partition("@")
+    return (
+        bool(local_part)
+        and bool(at_sign)
+        and "@" not in domain
+        and "." in domain[1:-1]
+        # split() only returns the string unchanged when it has no whitespace at all.
+        and email.split(maxsplit=1) == [email]
+    )
+
+
+def parse_submission_form(form: Mapping[str, str]) -> tuple[str, str, str | None]:
+    """Read, normalize and validate the signup form in one go.
+
+    Returns (email, poll_answer, error). error is None when everything is valid;
+    otherwise it is the message to show, and the normalized values are still
+    returned so the form can be refilled.
+    """
+    email = normalize_text(form.get("email", "")).lower()
+    poll_answer = normalize_text(form.get("poll_answer", ""))
+
+    if not email or not poll_answer:
+        return email, poll_answer, "Please enter your email and choose one poll option."
+    if not is_valid_email(email):
+        return email, poll_answer, "Please enter a valid email address."
+    if poll_answer not in config.POLL_OPTIONS_SET:
+        return email, poll_answer, "Please select a valid poll option."
+    return email, poll_answer, None
 
 
 def csv_safe(value: str) -> str:
@@ -78,103 +388,212 @@ def csv_safe(value: str) -> str:
 
     If a value starts with spreadsheet formula characters, prefix a single quote.
     """
-    if value and value[0] in ("=", "+", "-", "@"):
+    if value.startswith(CSV_FORMULA_PREFIXES):
         return f"'{value}"
     return value
 
 
-def page_context(extra: dict[str, Any] | None = None) -> dict[str, Any]:
+def csv_quote(value: str) -> str:
+    """Wrap a value in double quotes for CSV, doubling any quotes inside it.
+
+    Emails may legally contain commas or quotes, so text fields are always quoted.
+    """
+    return '"' + value.replace('"', '""') + '"'
+
+
+def page_context(extra: dict[str, Any] | None = None) -> Mapping[str, Any]:
     """Central place for template values from config.py.
 
     This keeps templates dynamic and makes project reuse simple.
+    Without extra values the shared read-only base context is returned as-is.
     """
-    context: dict[str, Any] = {
-        "site_title": config.SITE_TITLE,
-        "headline": config.HEADLINE,
-        "description": config.DESCRIPTION,
-        "poll_question": config.POLL_QUESTION,
-        "poll_options": config.POLL_OPTIONS,
-    }
-    if extra:
-        context.update(extra)
-    return context
+    if not extra:
+        return _BASE_CONTEXT
+    return {**_BASE_CONTEXT, **extra}
 
 
-@app.route("/")
-def index() -> str:
-    """Landing page route."""
-    return render_template("index.html", **page_context())
+def iter_export_csv(cursor: sqlite3.Cursor) -> Iterator[str]:
+    """Yield the CSV export line by line, newest submissions first.
 
+    Rows are read in batches along the created_at index. Each batch continues after
+    the last row of the previous one (keyset pagination), so memory use stays flat
+    no matter how many signups there are. The cursor must return plain tuples.
+    """
+    yield CSV_HEADER
+    rows = cursor.execute(EXPORT_FIRST_BATCH_SQL, (EXPORT_BATCH_SIZE,)).fetchall()
+    while rows:
+        for row_id, email, poll_answer, created_at in rows:
+            # id is an integer; every text column is quoted and guarded, because rows
+            # written before validation existed (or edited by hand) may contain anything.
+            yield (
+                f"{row_id},{csv_quote(csv_safe(email))},"
+                f"{csv_quote(csv_safe(poll_answer))},{csv_quote(csv_safe(created_at))}\r\n"
+            )
+        last_id, _, _, last_created_at = rows[-1]
+        rows = cursor.execute(
+            EXPORT_NEXT_BATCH_SQL, (last_created_at, last_id, EXPORT_BATCH_SIZE)
+        ).fetchall()
 
-@app.route("/submit", methods=["POST"])
-def submit() -> Response | str:
-    """Handle form submission with validation and duplicate prevention."""
-    raw_email = request.form.get("email", "")
-    raw_poll_answer = request.form.get("poll_answer", "")
 
-    email = normalize_text(raw_email).lower()
-    poll_answer = normalize_text(raw_poll_answer)
+def open_export_snapshot() -> tuple[BinaryIO, str]:
+    """Return an open CSV snapshot of all submissions and its version key.
 
-    # Preserve entered values if there is an error.
-    form_values = {"email": email, "selected_poll_answer": poll_answer}
+    The key combines a random id for this database file with a counter that
+    triggers bump on every insert, update or delete, so it changes whenever the
+    exported data could change. Snapshots are named after it: if the file for the
+    current key exists it is reused, otherwise it is written once and older
+    snapshots are removed. The returned file is already open, so it can still be
+    sent even if a newer snapshot deletes it in the meantime.
+    """
+    # Plain tuples are quicker to unpack than sqlite3.Row in the export loop. The
+    # setting only applies to this cursor, so the shared connection keeps sqlite3.Row.
+    cursor = get_db_connection().cursor()
+    cursor.row_factory = None
 
-    if not email or not poll_answer:
-        return render_template(
-            "index.html",
-            **page_context(
-                {
-                    "error": "Please enter your email and choose one poll option.",
-                    **form_values,
-                }
-            ),
-        )
+    # One read transaction so the version key and the exported rows always match.
+    cursor.execute("BEGIN")
+    try:
+        (version,) = cursor.execute(EXPORT_VERSION_SQL).fetchone()
+        path = EXPORT_DIR / f"submissions-{version}.csv"
+        try:
+            return path.open("rb"), version
+        except FileNotFoundError:
+            pass
+
+        # Write to a temporary file first and rename it into place, so other workers
+        # never see a half-written snapshot.
+        EXPORT_DIR.mkdir(exist_ok=True)
+        snapshot = tempfile.NamedTemporaryFile(dir=EXPORT_DIR, suffix=".tmp", delete=False)
+        try:
+            for line in iter_export_csv(cursor):
+                snapshot.write(line.encode("utf-8"))
+            # Windows cannot rename a file that is still open, so close it first.
+            snapshot.close()
+            os.replace(snapshot.name, path)
+        except BaseException:
+            snapshot.close()
+            Path(snapshot.name).unlink(missing_ok=True)
+            raise
+    finally:
+        cursor.execute("COMMIT")
+
+    # Best-effort cleanup: on Windows a snapshot that another request is still
+    # sending cannot be deleted yet; it is removed by a later rebuild instead.
+    for old_path in EXPORT_DIR.glob("submissions-*.csv"):
+        if old_path != path:
+            try:
+                old_path.unlink()
+            except OSError:
+                pass
+
+    try:
+        return path.open("rb"), version
+    except FileNotFoundError:
+        # A newer snapshot replaced this one in the meantime, so send that instead.
+        return open_export_snapshot()
 
-    if not is_valid_email(email):
-        return render_template(
-            "index.html",
-            **page_context(
-                {
-                    "error": "Please enter a valid email address.",
-                    **form_values,
-                }
-            ),
-        )
 
-    if poll_answer not in config.POLL_OPTIONS:
-        return render_template(
-            "index.html",
-            **page_context(
-                {
-                    "error": "Please select a valid poll option.",
-                    **form_values,
-                }
-            ),
+def render_poll_options(selected: str | None) -> Markup:
+    """Render the poll radio buttons, with `selected` checked (None = nothing checked)."""
+    return Markup(
+        app.jinja_env.get_template("_poll_options.html").render(
+            poll_options=config.POLL_OPTIONS, selected_poll_answer=selected
         )
+    )
 
-    created_at = datetime.now(timezone.utc).isoformat()
 
-    try:
-        with get_db_connection() as connection:
-            connection.execute(
-                """
-                INSERT INTO submissions (email, poll_answer, created_at)
-                VALUES (?, ?, ?)
-                """,
-                (email, poll_answer, created_at),
-            )
-            connection.commit()
-    except sqlite3.IntegrityError:
-        return render_template(
-            "index.html",
-            **page_context(
-                {
-                    "error": "This email is already registered. Thanks for your interest!",
-                    **form_values,
-                }
-            ),
+# The poll radio buttons only depend on config.POLL_OPTIONS, so they are rendered
+# once per possible selection and dropped into index.html as ready-made,
+# already-escaped HTML.
+_POLL_HTML: Mapping[str | None, Markup] = MappingProxyType(
+    {selected: render_poll_options(selected) for selected in (None, *config.POLL_OPTIONS)}
+)
+
+
+def poll_options_html(selected: str | None) -> Markup:
+    """Return the pre-rendered poll radio buttons for `selected`.
+
+    Unknown answers get the fragment with nothing checked. In debug mode the partial
+    is rendered again so template edits show up without a restart.
+    """
+    if app.debug:
+        return render_poll_options(selected if selected in config.POLL_OPTIONS_SET else None)
+    return _POLL_HTML.get(selected, _POLL_HTML[None])
+
+
+def render_form_error(error: str, email: str, poll_answer: str) -> str:
+    """Show the landing page again with an error and the values the user entered."""
+    return render_template(
+        "index.html",
+        **page_context(
+            {"error": error, "email": email, "poll_html": poll_options_html(poll_answer)}
+        ),
+    )
+
+
+@app.after_request
+def drop_date_header(response: Response) -> Response:
+    """Leave the Date header to the server.
+
+    make_conditional() (used for ETags and Range requests) adds its own Date, and
+    servers such as uvicorn and gunicorn always add one too, which would send it twice.
+    """
+    response.headers.pop("Date", None)
+    return response
+
+
+@app.route("/")
+def index() -> Response:
+    """Landing page route.
+
+    The page only depends on config.py, so it is rendered once on the first visit and
+    the same bytes are reused afterwards. The ETag lets browsers revalidate with a
+    tiny 304 response. In debug mode the page is re-rendered so template edits show up.
+    """
+    global _index_cache
+    cache = _index_cache
+    if cache is None or app.debug:
+        page = render_template(
+            "index.html", **page_context({"poll_html": poll_options_html(None)})
+        ).encode("utf-8")
+        cache = _index_cache = (page, hashlib.sha1(page).hexdigest())
+
+    page, etag = cache
+    response = Response(page, mimetype="text/html")
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+@app.route("/submit", methods=["POST"])
+def submit() -> Response | str:
+    """Handle form submission with validation and duplicate prevention."""
+    email, poll_answer, error = parse_submission_form(request.form)
+    if error:
+        return render_form_error(error, email, poll_answer)
+
+    connection = get_db_connection()
+
+    # Check for a duplicate first: "email" is UNIQUE, so this is a quick index lookup
+    # and retries from people who already signed up never reach the INSERT.
+    already_registered = (
+        connection.execute(EMAIL_EXISTS_SQL, (email,)).fetchone()
+        is not None
+    )
+
+    if not already_registered:
+        try:
+            with transaction(connection):
+                connection.execute(INSERT_SUBMISSION_SQL, (email, poll_answer))
+        except sqlite3.IntegrityError:
+            # Another request registered the same email between the check and the INSERT.
+            already_registered = True
+
+    if already_registered:
+        return render_form_error(
+            "This email is already registered. Thanks for your interest!", email, poll_answer
         )
 
-    logger.info("New signup: email=%s poll_answer=%s at=%s", email, poll_answer, created_at)
+    logger.info("New signup: email=%s poll_answer=%s", email, poll_answer)
     return redirect(url_for("thank_you"))
 
 
@@ -186,37 +605,25 @@ def thank_you() -> str:
 
 @app.route("/admin/export")
 def admin_export() -> Response:
-    """Download all submissions as CSV."""
-    with get_db_connection() as connection:
-        submissions = connection.execute(
-            "SELECT id, email, poll_answer, created_at FROM submissions ORDER BY created_at DESC"
-        ).fetchall()
+    """Download all submissions as CSV.
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["id", "email", "poll_answer", "created_at"])
-
-    for row in submissions:
-        writer.writerow(
-            [
-                row["id"],
-                csv_safe(row["email"]),
-                csv_safe(row["poll_answer"]),
-                csv_safe(row["created_at"]),
-            ]
-        )
-
-    csv_data = output.getvalue()
-
-    # Bonus: include submission count in headers for a quick admin success indicator.
-    return Response(
-        csv_data,
+    The CSV comes from a snapshot file that is only rebuilt after the submissions
+    change, so repeated downloads skip the database and are sent straight from disk.
+    """
+    snapshot, version = open_export_snapshot()
+    response = send_file(
+        snapshot,
         mimetype="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=submissions.csv",
-            "X-Total-Submissions": str(len(submissions)),
-        },
+        as_attachment=True,
+        download_name="submissions.csv",
+        etag=f"submissions-{version}",
+        conditional=False,
     )
+    # send_file() cannot see the size of an already-open file, so pass it along here
+    # to get Content-Length, resumable downloads (Range) and 304 responses.
+    size = os.fstat(snapshot.fileno()).st_size
+    response.content_length = size
+    return response.make_conditional(request, accept_ranges=True, complete_length=size)
 
 
 if __name__ == "__main__":
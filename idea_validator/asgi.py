@@ -0,0 +1,20 @@
+"""ASGI entry point so the app can run under uvicorn.
+
+uvicorn (with uvloop and httptools) handles the network connections on an event
+loop. a2wsgi's WSGIMiddleware hands each Flask request to a pool of
+WSGI_THREADS worker threads, so each uvicorn worker process can serve that many
+requests at the same time. A slow CSV download occupies one thread, not the
+whole process.
+
+Run it with:
+    uvicorn asgi:asgi_app --loop uvloop --http httptools --workers 2
+"""
+
+from a2wsgi import WSGIMiddleware
+
+from app import app
+
+# Flask requests each uvicorn worker process can run at the same time.
+WSGI_THREADS = 10
+
+asgi_app = WSGIMiddleware(app, workers=WSGI_THREADS)
@@ -10,9 +10,13 @@ DESCRIPTION = (
     "We will share updates with people who sign up first."
 )
 POLL_QUESTION = "Which feature should we focus on first?"
-POLL_OPTIONS = [
+# A tuple (not a list) so the options cannot be changed while the app is running.
+POLL_OPTIONS = (
     "Simple MVP with core feature",
     "Automation and integrations",
     "Analytics dashboard",
     "Mobile-friendly experience",
-]
+)
+
+# Same options as a set, used by app.py for fast validation (keep the tuple above for display order).
+POLL_OPTIONS_SET = frozenset(POLL_OPTIONS)